@@ -31,6 +31,9 @@ class Configuration:
     compact_mode: bool = False
     """Use compact mode?"""
 
+    server_check_interval: int = 300
+    """Seconds after a download during which we won't check the server for newer data."""
+
     bindings: dict[str, str] = field(default_factory=dict)
     """Command keyboard binding overrides."""
 
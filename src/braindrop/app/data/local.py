@@ -2,12 +2,16 @@
 
 ##############################################################################
 # Python imports.
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from json import dumps, loads
 from pathlib import Path
 from typing import Any, Final, Self
 
+##############################################################################
+# orjson imports.
+from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS, dumps, loads
+
 ##############################################################################
 # pytz imports.
 from pytz import UTC
@@ -62,6 +66,8 @@ class LocalData:
         """All Raindrops in trash."""
         self._collections: dict[int, Collection] = {}
         """An index of all of the Raindrops we know about."""
+        self._children: dict[int | None, tuple[Collection, ...]] = {}
+        """An index of collections by the identity of their parent."""
         self._last_downloaded: datetime | None = None
         """The time the data was last downloaded from the server."""
         self._version: int | None = None
@@ -211,6 +217,63 @@ class LocalData:
         """
         return list(self._collections.values())
 
+    def _set_collections(self, collections: Iterable[Collection]) -> None:
+        """Set the collections, and index them.
+
+        Args:
+            collections: The collections to set.
+        """
+        index: dict[int, Collection] = {}
+        children: dict[int | None, list[Collection]] = {}
+        for collection in collections:
+            index[collection.identity] = collection
+            children.setdefault(collection.parent, []).append(collection)
+        # Only swap the new indexes in once they're fully built, so that
+        # nothing looking at them from another thread sees them half-made.
+        self._collections = index
+        self._children = {
+            parent: tuple(collections) for parent, collections in children.items()
+        }
+
+    def children_of(self, parent: Collection | int) -> tuple[Collection, ...]:
+        """Get the immediate child collections of a given collection.
+
+        Args:
+            parent: The collection, or its identity, to get the children of.
+
+        Returns:
+            The child collections, in the order they are held locally.
+        """
+        return self._children.get(
+            parent.identity if isinstance(parent, Collection) else parent, ()
+        )
+
+    def descendants_of(
+        self, parent: Collection | int
+    ) -> Iterator[tuple[Collection, int]]:
+        """Get all of the descendant collections of a given collection.
+
+        Args:
+            parent: The collection, or its identity, to get the descendants of.
+
+        Yields:
+            Each descendant collection, and its depth below the parent.
+
+        Notes:
+            The descendants are yielded depth-first, each collection being
+            followed by its own descendants; immediate children of the
+            parent have a depth of 1.
+        """
+        # Walk the hierarchy with our own stack, rather than recursing, so
+        # deep hierarchies don't pile up generator frames.
+        stack = deque((child, 1) for child in self.children_of(parent))
+        while stack:
+            collection, depth = stack.popleft()
+            yield collection, depth
+            stack.extendleft(
+                (child, depth + 1) for child in reversed(self.children_of(collection))
+            )
+
     def collections_within(self, group: Group) -> list[Collection]:
         """Find all the collections contained within a root.
 
@@ -234,9 +297,7 @@ class LocalData:
                 try:
                     yield self.collection(collection)
                     yield from _collections(
-                        candidate.identity
-                        for candidate in self.collections
-                        if candidate.parent == collection
+                        child.identity for child in self.children_of(collection)
                     )
                 except self.UnknownCollection:
                     pass
@@ -298,10 +359,7 @@ class LocalData:
             )
         )
         status_update("Downloading all collections")
-        self._collections = {
-            collection.identity: collection
-            for collection in await self._api.collections("all")
-        }
+        self._set_collections(await self._api.collections("all"))
         return self.mark_downloaded()
 
     @property
@@ -324,8 +382,8 @@ class LocalData:
         Returns:
             Self.
         """
-        local_data_file().write_text(
-            dumps(self._local_json, indent=4), encoding="utf-8"
+        local_data_file().write_bytes(
+            dumps(self._local_json, option=OPT_INDENT_2 | OPT_NON_STR_KEYS)
         )
         return self
 
@@ -335,25 +393,30 @@ class LocalData:
         Returns:
             Self.
         """
-        if local_data_file().exists():
-            data = loads(local_data_file().read_text(encoding="utf-8"))
-            self._version = data.get("version")
-            if self.outdated_format:
-                # The version is unknown, or older than we're expecting, so
-                # let's pretend it doesn't exist.
-                return self
-            self._last_downloaded = get_time(data, "last_downloaded")
-            self._user = User.from_json(data.get("user", {}))
-            self._all.set_to(
-                Raindrop.from_json(raindrop) for raindrop in data.get("all", [])
-            )
-            self._trash.set_to(
-                Raindrop.from_json(raindrop) for raindrop in data.get("trash", [])
-            )
-            self._collections = {
-                int(k): Collection.from_json(v)
-                for k, v in data.get("collections", {}).items()
-            }
+        # Pull the whole file in with a single bulk read, as raw bytes, and
+        # hand that straight to the JSON parser; there's no need to first
+        # decode it all into a string.
+        try:
+            data = loads(local_data_file().read_bytes())
+        except FileNotFoundError:
+            return self
+        self._version = data.get("version")
+        if self.outdated_format:
+            # The version is unknown, or older than we're expecting, so
+            # let's pretend it doesn't exist.
+            return self
+        self._last_downloaded = get_time(data, "last_downloaded")
+        self._user = User.from_json(data.get("user", {}))
+        self._all.set_to(
+            Raindrop.from_json(raindrop) for raindrop in data.get("all", [])
+        )
+        self._trash.set_to(
+            Raindrop.from_json(raindrop) for raindrop in data.get("trash", [])
+        )
+        self._set_collections(
+            Collection.from_json(collection)
+            for collection in data.get("collections", {}).values()
+        )
         return self
 
     def add(self, raindrop: Raindrop) -> Self:
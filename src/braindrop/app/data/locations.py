@@ -2,6 +2,7 @@
 
 ##############################################################################
 # Python imports.
+from functools import cache
 from pathlib import Path
 
 ##############################################################################
@@ -28,6 +29,7 @@ def _app_dir(root: Path) -> Path:
 
 
 ##############################################################################
+@cache
 def data_dir() -> Path:
     """The path to the data directory for the application.
 
@@ -37,11 +39,15 @@ def data_dir() -> Path:
     Note:
         If the directory doesn't exist, it will be created as a side-effect
         of calling this function.
+
+        The location is only worked out, and created, on the first call;
+        after that the same path is returned.
     """
     return _app_dir(xdg_data_home())
 
 
 ##############################################################################
+@cache
 def config_dir() -> Path:
     """The path to the configuration directory for the application.
 
@@ -51,6 +57,9 @@ def config_dir() -> Path:
     Note:
         If the directory doesn't exist, it will be created as a side-effect
         of calling this function.
+
+        The location is only worked out, and created, on the first call;
+        after that the same path is returned.
     """
     return _app_dir(xdg_config_home())
 
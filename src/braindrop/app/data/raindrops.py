@@ -10,6 +10,7 @@ from collections import Counter
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from functools import total_ordering
+from operator import attrgetter
 from typing import Self
 
 ##############################################################################
@@ -40,11 +41,7 @@ class TagCount:
         Returns:
             A function to get the tag of a `TagCount` instance.
         """
-
-        def _getter(data: TagCount) -> Tag:
-            return data.tag
-
-        return _getter
+        return attrgetter("tag")
 
     @staticmethod
     def the_count() -> Callable[[TagCount], int]:
@@ -53,11 +50,7 @@ class TagCount:
         Returns:
             A function to get the count of a `TagCount` instance.
         """
-
-        def _getter(data: TagCount) -> int:
-            return data.count
-
-        return _getter
+        return attrgetter("count")
 
 
 ##############################################################################
@@ -393,6 +386,39 @@ class Raindrops:
             raindrops = raindrops & next_filter
         return raindrops
 
+    def __eq__(self, value: object, /) -> bool:
+        """Is this group of Raindrops equal to another?
+
+        Args:
+            value: The value to compare against.
+
+        Returns:
+            `True` if the groups are the same, `False` if not.
+
+        Notes:
+            Two groups are considered equal if they have the same title,
+            came from the same collection, have had the same filters
+            applied, and hold the same Raindrops.
+        """
+        if isinstance(value, Raindrops):
+            return self is value or (
+                self._title == value._title
+                and self._root_collection.identity == value._root_collection.identity
+                and self._filters == value._filters
+                and self._raindrops == value._raindrops
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """The hash of the group of Raindrops.
+
+        Notes:
+            Only the title and the root collection are used, as they don't
+            change over the life of the group, while the Raindrops it holds
+            can.
+        """
+        return hash((self._title, self._root_collection.identity))
+
     def __contains__(self, raindrop: Raindrop) -> bool:
         """Is the given raindrop in here?"""
         return raindrop.identity in self._index
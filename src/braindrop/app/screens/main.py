@@ -2,7 +2,10 @@
 
 ##############################################################################
 # Python imports.
+from asyncio import Task, create_task, to_thread
 from collections.abc import Callable
+from datetime import datetime
+from typing import Final
 from webbrowser import open as open_url
 
 ##############################################################################
@@ -10,11 +13,17 @@ from webbrowser import open as open_url
 from pyperclip import PyperclipException
 from pyperclip import copy as to_clipboard
 
+##############################################################################
+# pytz imports.
+from pytz import UTC
+
 ##############################################################################
 # Textual imports.
 from textual import on, work
 from textual.app import ComposeResult
 from textual.reactive import var
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Footer, Header
 from textual_enhanced.commands import ChangeTheme, Command, Help, Quit
 
@@ -167,12 +176,18 @@ class Main(EnhancedScreen[None]):
 
     COMMANDS = {MainCommands}
 
-    active_collection: var[Raindrops] = var(Raindrops, always_update=True)
+    active_collection: var[Raindrops] = var(Raindrops)
     """The currently-active collection."""
 
     highlighted_raindrop: var[Raindrop | None] = var(None)
     """The currently-highlighted raindrop."""
 
+    detailed_raindrop: var[Raindrop | None] = var(None)
+    """The raindrop whose details are being shown."""
+
+    DETAILS_DELAY: Final[float] = 0.05
+    """Seconds a raindrop must stay highlighted before its details are shown."""
+
     def __init__(self, api: API) -> None:
         """Initialise the main screen.
 
@@ -190,6 +205,12 @@ class Main(EnhancedScreen[None]):
         """Used to hold on to Raindrop data until we know it's been added or edited."""
         self._redownload_wiggle_room = 2
         """The number of seconds difference needs to exist to consider a full redownload."""
+        self._details_timer: Timer | None = None
+        """The timer for showing the details of the highlighted raindrop."""
+        self._escape_route: dict[Widget, Widget] = {}
+        """Where focus should go when escaping from a given widget."""
+        self._user_request: Task[User | None] | None = None
+        """The request for the user's details made once local data is loaded."""
         CollectionCommands.data = self._data
 
     def compose(self) -> ComposeResult:
@@ -198,10 +219,29 @@ class Main(EnhancedScreen[None]):
         yield Navigation(self._api, classes="panel").data_bind(Main.active_collection)
         yield RaindropsView(classes="panel").data_bind(raindrops=Main.active_collection)
         yield RaindropDetails(classes="panel").data_bind(
-            raindrop=Main.highlighted_raindrop
+            raindrop=Main.detailed_raindrop
         )
         yield Footer()
 
+    @property
+    def _data_is_fresh(self) -> bool:
+        """Is the local data fresh enough that the server needn't be checked?
+
+        Notes:
+            The local data is considered fresh if it's in the current
+            format and was pulled down from the server very recently.
+        """
+        return (
+            not self._data.outdated_format
+            and self._data.last_downloaded is not None
+            and (datetime.now(UTC) - self._data.last_downloaded).total_seconds()
+            < load_configuration().server_check_interval
+        )
+
+    def _request_user(self) -> None:
+        """Get the request for the user's details underway."""
+        self._user_request = create_task(self._api.user())
+
     @work
     async def maybe_redownload(self) -> None:
         """Redownload the Raindrop data if it looks like server data is newer."""
@@ -209,11 +249,18 @@ class Main(EnhancedScreen[None]):
         # Ensure that whatever we have at the moment is visible.
         self.populate_display()
 
+        # If the local data is fresh, don't bother checking in with the
+        # server; the chances are nothing has changed.
+        if self._data_is_fresh:
+            self._user = self._data.user
+            return
+
         # First off, get the user information. It's via this where we'll
         # figure out the last server activity and will then be able to
         # figure out if we're out of date down here.
+        user_request, self._user_request = self._user_request, None
         try:
-            self._user = await self._api.user()
+            self._user = await (user_request or self._api.user())
         except API.Error as error:
             self.app.bell()
             self.notify(
@@ -267,6 +314,11 @@ class Main(EnhancedScreen[None]):
     def load_data(self) -> None:
         """Load the Raindrop data, either from local or remote, depending."""
         self._data.load()
+        # If we're going to need to check in with the server, get the
+        # request for the user's details underway now, so that it overlaps
+        # with populating the display.
+        if not self._data_is_fresh:
+            self.app.call_from_thread(self._request_user)
         self.app.call_from_thread(self.maybe_redownload)
 
     @work
@@ -285,8 +337,22 @@ class Main(EnhancedScreen[None]):
         self.set_class(not config.details_visible, "details-hidden")
         self.query_one(Navigation).tags_by_count = config.show_tags_by_count
         self.query_one(RaindropsView).compact_view = config.compact_mode
+        # Map out how escape steps focus back out through the panels:
+        # anything within the details goes to the details, the details go
+        # to the raindrops, the raindrops go to the navigation.
+        details = self.query_one(RaindropDetails)
+        raindrops = self.query_one(RaindropsView)
+        self._escape_route = {
+            **dict.fromkeys(details.children, details),
+            details: raindrops,
+            raindrops: self.query_one(Navigation),
+        }
         self.load_data()
 
+    async def on_unmount(self) -> None:
+        """Tidy up the connection to the API when the screen goes away."""
+        await self._api.close()
+
     def watch_active_collection(self) -> None:
         """Handle the active collection being changed."""
         if self.active_collection.title:
@@ -296,13 +362,29 @@ class Main(EnhancedScreen[None]):
         else:
             self.sub_title = "Loading..."
 
+    def _force_active_collection(self, collection: Raindrops) -> None:
+        """Set the active collection, even if it looks unchanged.
+
+        Args:
+            collection: The collection to make active.
+
+        Notes:
+            Assigning to `active_collection` is a no-op if the new value is
+            equal to the current one. When the underlying data has changed
+            we always want the display to react, so this method should be
+            used in those situations.
+        """
+        self.set_reactive(Main.active_collection, collection)
+        self.mutate_reactive(Main.active_collection)
+
     def populate_display(self) -> None:
         """Populate the display."""
-        self.query_one(Navigation).data = self._data
+        navigation = self.query_one(Navigation)
+        navigation.show_data(self._data, self._data.all)
         self.query_one(RaindropsView).data = self._data
         self.query_one(RaindropDetails).data = self._data
-        self.active_collection = self._data.all
-        self.query_one(Navigation).highlight_collection(SpecialCollection.ALL())
+        self._force_active_collection(self._data.all)
+        navigation.highlight_collection(SpecialCollection.ALL())
 
     @on(ShowCollection)
     def command_show_collection(self, command: ShowCollection) -> None:
@@ -356,6 +438,25 @@ class Main(EnhancedScreen[None]):
         """Handle the highlighted raindrop changing."""
         self.highlighted_raindrop = message.raindrop
 
+    def _show_highlighted_details(self) -> None:
+        """Show the details of the currently-highlighted raindrop."""
+        self.detailed_raindrop = self.highlighted_raindrop
+
+    def watch_highlighted_raindrop(self) -> None:
+        """Handle the highlighted raindrop changing.
+
+        Notes:
+            When the user is moving quickly through the list of raindrops
+            there's little point in showing the details of every raindrop
+            that is passed over; so the details are only updated once the
+            highlight has settled for a moment.
+        """
+        if self._details_timer is not None:
+            self._details_timer.stop()
+        self._details_timer = self.set_timer(
+            self.DETAILS_DELAY, self._show_highlighted_details
+        )
+
     @on(Redownload)
     def action_redownload_command(self) -> None:
         """Redownload data from the server."""
@@ -367,11 +468,10 @@ class Main(EnhancedScreen[None]):
 
     def action_tag_order_command(self) -> None:
         """Toggle the ordering of tags."""
-        self.query_one(Navigation).tags_by_count = (
-            by_count := not self.query_one(Navigation).tags_by_count
-        )
+        navigation = self.query_one(Navigation)
+        navigation.tags_by_count = not navigation.tags_by_count
         with update_configuration() as config:
-            config.show_tags_by_count = by_count
+            config.show_tags_by_count = navigation.tags_by_count
 
     def action_show_all_command(self) -> None:
         """Select the collection that shows all Raindrops."""
@@ -396,14 +496,10 @@ class Main(EnhancedScreen[None]):
         level to the topmost, and if we're at the topmost then exit the
         application.
         """
-        if self.focused is not None and self.focused.parent is self.query_one(
-            RaindropDetails
+        if self.focused is not None and (
+            step_back := self._escape_route.get(self.focused)
         ):
-            self.set_focus(self.query_one(RaindropDetails))
-        elif self.focused is self.query_one(RaindropDetails):
-            self.set_focus(self.query_one(RaindropsView))
-        elif self.focused is self.query_one(RaindropsView):
-            self.set_focus(self.query_one(Navigation))
+            self.set_focus(step_back)
         else:
             self.app.exit()
 
@@ -447,10 +543,20 @@ class Main(EnhancedScreen[None]):
                 "Remove the local copy of your API token and delete the local copy of all your data?",
             )
         ):
-            token_file().unlink(True)
-            local_data_file().unlink(True)
+            await to_thread(self._forget_local_state)
             self.app.exit(ExitState.TOKEN_FORGOTTEN)
 
+    @staticmethod
+    def _forget_local_state() -> None:
+        """Remove the local copy of the API token and the Raindrop data.
+
+        Note:
+            This does blocking filesystem work so should be called from a
+            thread, not from the event loop.
+        """
+        token_file().unlink(True)
+        local_data_file().unlink(True)
+
     def action_quit_command(self) -> None:
         """Quit the application."""
         self.app.exit(ExitState.OKAY)
@@ -567,14 +673,16 @@ class Main(EnhancedScreen[None]):
             raindrop: The raindrop causing the refresh.
             confirmation: The message to show the user.
         """
-        with self.query_one(Navigation).preserved_highlight:
+        navigation = self.query_one(Navigation)
+        with navigation.preserved_highlight:
             # Ensure local storage is updated.
             local_save(raindrop)
-            # Get the navigation bar to refresh its content.
-            self.query_one(Navigation).data = self._data
             # Remake the active collection from the new data, keeping all
             # filtering intact.
-            self.active_collection = self._data.rebuild(self.active_collection)
+            active_collection = self._data.rebuild(self.active_collection)
+            # Get the navigation bar to refresh its content, in one go.
+            navigation.show_data(self._data, active_collection)
+            self._force_active_collection(active_collection)
             # Let the user know what happened.
             self.notify(confirmation)
 
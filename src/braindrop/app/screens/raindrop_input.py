@@ -2,7 +2,10 @@
 
 ##############################################################################
 # Python imports.
-from collections.abc import Iterator
+from asyncio import to_thread
+from collections.abc import AsyncIterator, Iterator
+from functools import cache, cached_property, lru_cache
+from typing import Final
 
 ##############################################################################
 # httpx imports.
@@ -18,9 +21,10 @@ from pyperclip import paste as from_clipboard
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
-from textual.events import DescendantBlur, DescendantFocus
+from textual.events import DescendantBlur
 from textual.screen import ModalScreen
-from textual.validation import Length, ValidationResult
+from textual.timer import Timer
+from textual.validation import Length
 from textual.widgets import Button, Input, Label, Select, TextArea
 
 ##############################################################################
@@ -29,12 +33,20 @@ from textual_enhanced.tools import add_key
 
 ##############################################################################
 # Local imports.
-from ...raindrop import API, Collection, Raindrop, SpecialCollection, Suggestions
+from ...raindrop import (
+    API,
+    Collection,
+    Raindrop,
+    SpecialCollection,
+    Suggestions,
+    Tag,
+)
 from ..data import LocalData
 from ..suggestions import SuggestTags
 
 
 ##############################################################################
+@lru_cache(maxsize=64)
 def looks_urlish(possible_url: str) -> bool:
     """Test if a string looks like a web-oriented URL.
 
@@ -44,12 +56,31 @@ def looks_urlish(possible_url: str) -> bool:
     Returns:
         `True` if the string looks like it might be a URL, `False` if not.
     """
+    # Most things we get asked about won't be anything like a URL, so
+    # don't go to the expense of parsing them if they don't even start
+    # like one.
+    if not possible_url[:8].lower().startswith(("http://", "https://")):
+        return False
     return (url := URL(possible_url)).is_absolute_url and url.scheme in (
         "http",
         "https",
     )
 
 
+##############################################################################
+@cache
+def _indent(depth: int) -> str:
+    """Get the indent for a collection at a given depth.
+
+    Args:
+        depth: The depth of the collection.
+
+    Returns:
+        The indent for the collection.
+    """
+    return "  " * depth
+
+
 ##############################################################################
 class RaindropInput(ModalScreen[Raindrop | None]):
     """The raindrop editing dialog."""
@@ -105,6 +136,9 @@ class RaindropInput(ModalScreen[Raindrop | None]):
 
     BINDINGS = [("escape", "cancel"), ("f2", "save")]
 
+    SUGGESTIONS_DELAY: Final[float] = 0.3
+    """Seconds the URL must be left alone after an edit before getting suggestions."""
+
     def __init__(self, api: API, data: LocalData, raindrop: Raindrop | None = None):
         """Initialise the dialog.
 
@@ -120,26 +154,84 @@ class RaindropInput(ModalScreen[Raindrop | None]):
         """The local raindrop data."""
         self._raindrop = raindrop or Raindrop()
         """The raindrop to edit, or `None` if this is a new raindrop."""
+        self._initial_tags = Raindrop.tags_to_string(self._raindrop.tags)
+        """The raindrop's tags as they were first shown for editing."""
         self._last_url = self._raindrop.link
-        """Keeps track of the last URL entered. Used to decide when to get suggestions."""
+        """Keeps track of the last URL suggestions were sought for."""
+        self._suggestions_timer: Timer | None = None
+        """The timer for getting suggestions after the URL has been edited."""
+        local_tags = self._data.all.tags
+        self._local_tags = frozenset(tag.tag for tag in local_tags)
+        """The tags that are in use locally."""
+        self._suggest_tags = SuggestTags(local_tags)
+        """The suggester for the tags input."""
+        self._invalid_inputs: set[Input] = set()
+        """The inputs that currently fail validation."""
+
+    @cached_property
+    def _title(self) -> Input:
+        """The input for the title of the raindrop."""
+        return self.query_one("#title", Input)
+
+    @cached_property
+    def _excerpt(self) -> TextArea:
+        """The input for the excerpt of the raindrop."""
+        return self.query_one("#excerpt", TextArea)
+
+    @cached_property
+    def _note(self) -> TextArea:
+        """The input for the note of the raindrop."""
+        return self.query_one("#note", TextArea)
+
+    @cached_property
+    def _url(self) -> Input:
+        """The input for the URL of the raindrop."""
+        return self.query_one("#url", Input)
+
+    @cached_property
+    def _collection(self) -> Select[int]:
+        """The input for the collection of the raindrop."""
+        return self.query_one("#collection", Select)
+
+    @cached_property
+    def _tags(self) -> Input:
+        """The input for the tags of the raindrop."""
+        return self.query_one("#tags", Input)
+
+    @cached_property
+    def _inputs(self) -> tuple[Input, ...]:
+        """All of the `Input` widgets in the dialog."""
+        return tuple(self.query(Input))
+
+    @cached_property
+    def _save(self) -> Button:
+        """The save button."""
+        return self.query_one("#save", Button)
+
+    @cached_property
+    def _collection_suggestions(self) -> Label:
+        """The display of suggested collections."""
+        return self.query_one("#collection-suggestions", Label)
+
+    @cached_property
+    def _tag_suggestions(self) -> Label:
+        """The display of suggested tags."""
+        return self.query_one("#tag-suggestions", Label)
 
     def _selectable_child_collections_of(
-        self, parent: Collection, indent: int = 0
+        self, parent: Collection
     ) -> Iterator[tuple[str, int]]:
         """Get child collections of the given collection for a `Select`.
 
         Args:
             parent: The parent collection to get the children for.
-            indent: The indent level.
 
         Yields:
             The title of the collection and its identity.
         """
-        indent += 1
-        for collection in self._data.collections:
-            if collection.parent == parent.identity:
-                yield f"{'  ' * indent}{collection.title}", collection.identity
-                yield from self._selectable_child_collections_of(collection, indent)
+        indent = _indent
+        for collection, depth in self._data.descendants_of(parent):
+            yield f"{indent(depth)}{collection.title}", collection.identity
 
     @property
     def _selectable_collections(self) -> Iterator[tuple[str, int]]:
@@ -193,7 +285,7 @@ class RaindropInput(ModalScreen[Raindrop | None]):
             yield Label("Tags:")
             yield Input(
                 placeholder=f"Raindrop tags ({Raindrop.TAG_STRING_SEPARATOR_TITLE} separated)",
-                suggester=SuggestTags(self._data.all.tags),
+                suggester=self._suggest_tags,
                 id="tags",
             )
             yield Label(id="tag-suggestions", classes="suggestions")
@@ -228,10 +320,9 @@ class RaindropInput(ModalScreen[Raindrop | None]):
             suggestions so it's easier for the user to know which are part
             of their tag scheme, and which aren't.
         """
-        local_tags = {tag.tag for tag in self._data.all.tags}
         return [
             f"[$text-primary]{tag}[/]"
-            if tag in local_tags
+            if tag in self._local_tags
             else f"[dim i $text-secondary]{tag}[/]"
             for tag in sorted(set(suggestions.tags))
         ]
@@ -239,9 +330,11 @@ class RaindropInput(ModalScreen[Raindrop | None]):
     @work(exclusive=True)
     async def _get_suggestions(self) -> None:
         """Load up fresh suggestions based on the URL."""
+        url = self._url.value
+        self._last_url = url.strip()
         # Don't bother trying to get suggestions if the URL in the URL input
         # doesn't look like an URL.
-        if not looks_urlish(url := self.query_one("#url", Input).value):
+        if not looks_urlish(url):
             return
         # Ask raindrop.io for suggestions.
         try:
@@ -253,21 +346,17 @@ class RaindropInput(ModalScreen[Raindrop | None]):
             )
             return
         # We got some suggestions data back, so make use of them.
-        self.query_one("#collection-suggestions", Label).update(
+        self._collection_suggestions.update(
             f"[b]Suggested:[/] {', '.join(self._collection_names(suggestions.collections))}"
         )
-        self.query_one("#tag-suggestions", Label).update(
+        self._tag_suggestions.update(
             f"[b]Suggested:[/] {', '.join(self._format_tag_suggestions(suggestions))}"
         )
-        self.query_one("#collection-suggestions").set_class(
+        self._collection_suggestions.set_class(
             bool(suggestions.collections), "got-suggestions"
         )
-        self.query_one("#tag-suggestions").set_class(
-            bool(suggestions.tags), "got-suggestions"
-        )
-        self.query_one("#tags", Input).suggester = SuggestTags(
-            set([*self._data.all.tags, *suggestions.tags])
-        )
+        self._tag_suggestions.set_class(bool(suggestions.tags), "got-suggestions")
+        self._suggest_tags.add_tags(suggestions.tags)
 
     def _paste(self, url: str) -> None:
         """Paste the given URL into the link field.
@@ -279,21 +368,36 @@ class RaindropInput(ModalScreen[Raindrop | None]):
             The given URL will only be pasted into the link input field if
             that field is empty.
         """
-        if not (link := self.query_one("#url", Input)).value:
-            link.value = url
+        if not self._url.value:
+            self._url.value = url
             self._get_suggestions()
 
-    @work(thread=True)
-    def _suggest_link(self) -> None:
-        """Get a link suggestion by peeking in the user's clipboard."""
-        # Look for something in the external clipboard.
+    async def _clipboard_contents(self) -> AsyncIterator[str]:
+        """Iterate the content of the clipboards.
+
+        Yields:
+            The content of the Textual-internal clipboard, then the content
+            of the external clipboard.
+
+        Notes:
+            The external clipboard is only consulted if the caller asks for
+            more than the internal clipboard; looking at the external
+            clipboard can be slow, so there's no sense in doing it if the
+            internal clipboard has what we need. When it is consulted it's
+            done in a thread so as not to block the event loop.
+        """
+        yield self.app.clipboard
         try:
-            external = from_clipboard()
+            yield await to_thread(from_clipboard)
         except PyperclipException:
-            external = ""
+            pass
+
+    @work
+    async def _suggest_link(self) -> None:
+        """Get a link suggestion by peeking in the user's clipboard."""
         # Looking at the Textual-internal clipboard, then the external
         # clipboard...
-        for candidate in (self.app.clipboard, external):
+        async for candidate in self._clipboard_contents():
             # ...only looking at the first line of what we find...
             try:
                 candidate = candidate.strip().splitlines()[0]
@@ -302,49 +406,101 @@ class RaindropInput(ModalScreen[Raindrop | None]):
             # If it looks like it might be a URL...
             if looks_urlish(candidate):
                 # ...paste it into the URL field.
-                self.app.call_from_thread(self._paste, candidate)
+                self._paste(candidate)
                 break
 
     def on_mount(self) -> None:
         """Configure the dialog once it's in the DOM."""
         if self._raindrop:
-            self.query_one("#title", Input).value = self._raindrop.title
-            self.query_one("#excerpt", TextArea).text = self._raindrop.excerpt
-            self.query_one("#note", TextArea).text = self._raindrop.note
-            self.query_one("#url", Input).value = self._raindrop.link
-            self.query_one("#collection", Select).value = self._raindrop.collection
-            self.query_one("#tags", Input).value = Raindrop.tags_to_string(
-                self._raindrop.tags
-            )
+            self._title.value = self._raindrop.title
+            self._excerpt.text = self._raindrop.excerpt
+            self._note.text = self._raindrop.note
+            self._url.value = self._raindrop.link
+            self._collection.value = self._raindrop.collection
+            self._tags.value = self._initial_tags
         if self._raindrop.link:
             self._get_suggestions()
-        else:
+        elif self._raindrop.is_brand_new:
+            # Only go looking in the clipboard for a new raindrop; there's no
+            # sense in filling in the link of a raindrop being edited.
             self._suggest_link()
+        self._invalid_inputs = {
+            check for check in self._inputs if not self._is_valid(check)
+        }
+        self._save.disabled = bool(self._invalid_inputs)
+
+    def _refresh_suggestions(self) -> None:
+        """Refresh the suggestions if the URL has been modified."""
+        if self._suggestions_timer is not None:
+            self._suggestions_timer.stop()
+            self._suggestions_timer = None
+        if not (url := self._url.value.strip()):
+            # The URL field is empty; clear the display of any suggestions
+            # and give up.
+            self.query(".suggestions").set_class(False, "got-suggestions")
+            return
+        if url != self._last_url:
+            # The URL has changed since last time; clear the display of any
+            # suggestions and try and get some new ones.
+            self.query(".suggestions").set_class(False, "got-suggestions")
+            self._get_suggestions()
 
-    @on(DescendantFocus, "#url")
-    def _remember_url(self, event: DescendantFocus) -> None:
-        """Save the URL on entry to the URL field.
+    @on(Input.Changed, "#url")
+    def _url_changed(self) -> None:
+        """Get fresh suggestions once the user has paused editing the URL.
 
-        Args:
-            event: The event to handle.
+        Notes:
+            Rather than wait for the user to leave the URL field, this
+            gets the suggestions underway as soon as the user stops
+            typing for a moment; that way they're often already on
+            display by the time the user gets to the tags.
         """
-        if isinstance(event.widget, Input):  # It should be, but narrow the type.
-            self._last_url = event.widget.value.strip()
+        if self._suggestions_timer is not None:
+            self._suggestions_timer.stop()
+        self._suggestions_timer = self.set_timer(
+            self.SUGGESTIONS_DELAY, self._refresh_suggestions
+        )
 
     @on(DescendantBlur, "#url")
-    def _refresh_suggestions(self, event: DescendantBlur) -> None:
+    def _left_url(self) -> None:
         """Refresh the suggestions when leaving the URL field, having modified it."""
-        if isinstance(event.widget, Input):  # It should be, but narrow the type.
-            if not event.widget.value.strip():
-                # The URL field is empty; clear the display of any
-                # suggestions and give up.
-                self.query(".suggestions").set_class(False, "got-suggestions")
-                return
-            if event.widget.value.strip() != self._last_url:
-                # The URL has changed since last time; clear the display of
-                # any suggestions and try and get some new ones.
-                self.query(".suggestions").set_class(False, "got-suggestions")
-                self._get_suggestions()
+        self._refresh_suggestions()
+
+    @staticmethod
+    def _is_valid(check: Input) -> bool:
+        """Is the given input valid?
+
+        Args:
+            check: The input to check.
+
+        Returns:
+            `True` if the input is valid, `False` if not.
+
+        Notes:
+            Unlike `_all_looks_good` this has no side effects; it doesn't
+            mark the input as invalid or notify the user of the problems.
+        """
+        return all(
+            validator.validate(check.value).is_valid for validator in check.validators
+        )
+
+    @on(Input.Changed)
+    def _update_save(self, event: Input.Changed) -> None:
+        """Only allow saving if the inputs look okay.
+
+        Args:
+            event: The event to handle.
+
+        Notes:
+            The input will have already validated itself for the change, so
+            this makes use of that result rather than validate every input
+            again on every keystroke.
+        """
+        if event.validation_result is None or event.validation_result.is_valid:
+            self._invalid_inputs.discard(event.input)
+        else:
+            self._invalid_inputs.add(event.input)
+        self._save.disabled = bool(self._invalid_inputs)
 
     def _all_looks_good(self) -> bool:
         """Does everything on the dialog look okay?
@@ -356,26 +512,33 @@ class RaindropInput(ModalScreen[Raindrop | None]):
             As a side effect `Input` validation is run and notifications
             will be shown for problems.
         """
-        bad_results: list[ValidationResult] = []
-        for check in self.query(Input):
-            result = check.validate(check.value)
-            if result is not None and not result.is_valid:
-                bad_results.append(result)
-        if bad_results:
+        problems: list[str] = []
+        for check in self._inputs:
+            if (result := check.validate(check.value)) is not None:
+                problems.extend(
+                    failure.description or f"{failure.value!r} is not valid"
+                    for failure in result.failures
+                )
+        if problems:
             self.app.bell()
             self.notify(
-                "\n- "
-                + (
-                    "\n- ".join(
-                        failure.description or f"{failure.value!r} is not valid"
-                        for result in bad_results
-                        for failure in result.failures
-                    )
-                ),
+                "\n- " + "\n- ".join(problems),
                 severity="error",
                 title="Missing or incorrect Raindrop data",
             )
-        return not bad_results
+        return not problems
+
+    @property
+    def _edited_tags(self) -> list[Tag]:
+        """The tags from the tags input.
+
+        Notes:
+            If the tags input hasn't been changed then the raindrop's
+            original tags are used as they are.
+        """
+        if self._tags.value == self._initial_tags:
+            return self._raindrop.tags
+        return Raindrop.string_to_tags(self._tags.value)
 
     @on(Button.Pressed, "#save")
     def action_save(self) -> None:
@@ -383,12 +546,12 @@ class RaindropInput(ModalScreen[Raindrop | None]):
         if self._all_looks_good():
             self.dismiss(
                 self._raindrop.edit(
-                    title=self.query_one("#title", Input).value,
-                    excerpt=self.query_one("#excerpt", TextArea).text,
-                    note=self.query_one("#note", TextArea).text,
-                    link=self.query_one("#url", Input).value,
-                    collection=self.query_one("#collection", Select).value,
-                    tags=Raindrop.string_to_tags(self.query_one("#tags", Input).value),
+                    title=self._title.value,
+                    excerpt=self._excerpt.text,
+                    note=self._note.text,
+                    link=self._url.value,
+                    collection=self._collection.value,
+                    tags=self._edited_tags,
                     # TODO: More
                 )
             )
@@ -2,6 +2,7 @@
 
 ##############################################################################
 # Python imports.
+from functools import cached_property
 from webbrowser import open as open_url
 
 ##############################################################################
@@ -60,6 +61,11 @@ class TokenInput(ModalScreen[str | None]):
 
     BINDINGS = [("escape", "cancel"), ("f1", "get_token")]
 
+    @cached_property
+    def _token(self) -> Input:
+        """The input for the token."""
+        return self.query_one(Input)
+
     def compose(self) -> ComposeResult:
         """Compose the content of the screen."""
         with Vertical() as dialog:
@@ -81,7 +87,7 @@ class TokenInput(ModalScreen[str | None]):
     @on(Input.Submitted)
     def confirm(self) -> None:
         """React to the user confirming their input."""
-        if token := self.query_one(Input).value.strip():
+        if token := self._token.value.strip():
             self.dismiss(token)
         else:
             self.notify("Please provide a token", severity="error")
@@ -95,7 +101,7 @@ class TokenInput(ModalScreen[str | None]):
     def action_get_token(self) -> None:
         """Open the page for getting an API token."""
         open_url("https://app.raindrop.io/settings/integrations")
-        self.query_one(Input).focus()
+        self._token.focus()
 
 
 ### token_input.py ends here
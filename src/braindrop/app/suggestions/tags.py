@@ -34,6 +34,25 @@ class SuggestTags(Suggester):
         self._tags = [tag.tag if isinstance(tag, TagCount) else tag for tag in tags]
         """The tags to take suggestions from."""
 
+    def add_tags(self, tags: Iterable[Tag]) -> bool:
+        """Add more tags to suggest from.
+
+        Args:
+            tags: The tags to add.
+
+        Returns:
+            `True` if any new tags were added, `False` if not.
+
+        Notes:
+            Tags that are already known to the suggester are ignored.
+        """
+        known = set(self._tags)
+        if new_tags := [tag for tag in dict.fromkeys(tags) if tag not in known]:
+            self._tags.extend(new_tags)
+            if self.cache is not None:
+                self.cache.clear()
+        return bool(new_tags)
+
     _SUGGESTABLE: Final[Pattern[str]] = compile(r".*[^,\s]$")
     """Regular expression to test if a value deserves a suggestion."""
 
@@ -4,6 +4,11 @@
 # Backward compatibility.
 from __future__ import annotations
 
+##############################################################################
+# Python imports.
+from collections.abc import Iterator
+from functools import cache, lru_cache
+
 ##############################################################################
 # Rich imports.
 from rich.console import Group, RenderableType
@@ -31,6 +36,71 @@ from ..data import LocalData, Raindrops, TagCount, TypeCount
 from ..messages import ShowCollection, ShowOfType, ShowTagged
 
 
+##############################################################################
+@cache
+def _indent(indent: int) -> str:
+    """Get the markup for the indent of a given level.
+
+    Args:
+        indent: The indent level.
+
+    Returns:
+        The markup for the indent.
+    """
+    return "[dim]>[/dim] " * indent
+
+
+##############################################################################
+@lru_cache(maxsize=4096)
+def _label(title: str, indent: int, key: str | None) -> Content:
+    """Get the label content for a navigation prompt.
+
+    Args:
+        title: The title for the label.
+        indent: The indent level for the label.
+        key: The optional key for the label.
+
+    Returns:
+        The content for the label.
+
+    Notes:
+        The same titles turn up over and over as the navigation is
+        rebuilt, so the parsed content is kept around for reuse.
+    """
+    return Content.from_markup(
+        f"{_indent(indent)}{title}"
+        + (f" [$footer-key-foreground]\\[{key or ''}][/]" if key else "")
+    )
+
+
+##############################################################################
+@cache
+def _collection_id(identity: int) -> str:
+    """Get the option ID for a collection with a given identity.
+
+    Args:
+        identity: The identity of the collection.
+
+    Returns:
+        The ID to use for the collection.
+    """
+    return f"collection-{identity}"
+
+
+##############################################################################
+@lru_cache(maxsize=256)
+def _heading(title: str) -> Group:
+    """Get the renderable for a heading in the navigation.
+
+    Args:
+        title: The title of the heading.
+
+    Returns:
+        The renderable for the heading.
+    """
+    return Group("", Rule(title, style="bold dim"))
+
+
 ##############################################################################
 class Title(Option):
     """Option for showing a title."""
@@ -41,11 +111,7 @@ class Title(Option):
         Args:
             title: The title to show.
         """
-        super().__init__(
-            Group("", Rule(title, style="bold dim")),
-            disabled=True,
-            id=f"_title_{title}",
-        )
+        super().__init__(_heading(title), disabled=True, id=f"_title_{title}")
 
 
 ##############################################################################
@@ -77,13 +143,7 @@ class NavigationView(Option):
         prompt = Table.grid(expand=True)
         prompt.add_column(ratio=1)
         prompt.add_column(justify="right")
-        prompt.add_row(
-            Content.from_markup(
-                f"{'[dim]>[/dim] ' * indent}{title}"
-                + (f" [$footer-key-foreground]\\[{key or ''}][/]" if key else "")
-            ),
-            f"[dim i]{count}[/]",
-        )
+        prompt.add_row(_label(title, indent, key), f"[dim i]{count}[/]")
         return prompt
 
 
@@ -101,7 +161,7 @@ class CollectionView(NavigationView):
         Returns:
             The ID to use for the collection.
         """
-        return f"collection-{collection.identity}"
+        return _collection_id(collection.identity)
 
     def __init__(
         self,
@@ -198,7 +258,7 @@ class Navigation(EnhancedOptionList):
     data: var[LocalData | None] = var(None, always_update=True)
     """Holds a reference to the Raindrop data we're going to handle."""
 
-    active_collection: var[Raindrops] = var(Raindrops(), always_update=True)
+    active_collection: var[Raindrops] = var(Raindrops())
     """The currently-active collection being displayed."""
 
     tags_by_count: var[bool] = var(False)
@@ -222,6 +282,27 @@ class Navigation(EnhancedOptionList):
         super().__init__(id=id, classes=classes, disabled=disabled)
         self._api = api
         """The API client object."""
+        self._main_options: list[Option] | None = None
+        """The options for the main navigation, if they've been built."""
+        self._tags: list[TagCount] | None = None
+        """The tags of the active collection, if they've been gathered."""
+        self._sorted_tags: dict[bool, list[TagCount]] = {}
+        """The sorted tags of the active collection, keyed by sort-by-count."""
+
+    def show_data(self, data: LocalData, active_collection: Raindrops) -> None:
+        """Show the given data with the given collection active.
+
+        Args:
+            data: The Raindrop data to show.
+            active_collection: The collection that is active.
+
+        Notes:
+            Setting `data` and `active_collection` one after the other
+            would rebuild the navigation twice; this method sets them both
+            and rebuilds just the once.
+        """
+        self.set_reactive(Navigation.active_collection, active_collection)
+        self.data = data
 
     def highlight_collection(self, collection: Collection) -> None:
         """Ensure the given collection is highlighted.
@@ -248,86 +329,86 @@ class Navigation(EnhancedOptionList):
         """Show the special collection that is the unsorted Raindrops."""
         self.select_collection(SpecialCollection.UNSORTED())
 
-    def _add_collection(
+    def _collection_option(
         self, collection: Collection, indent: int = 0, key: str | None = None
-    ) -> Collection:
-        """Add a collection to the widget.
+    ) -> CollectionView:
+        """Create the option for a collection.
 
         Args:
-            collection: The collection to add.
-            indent: The indent level to add it at.
+            collection: The collection to create the option for.
+            indent: The indent level to show it at.
             key: The shortcut key to use, if any.
 
         Returns:
-            The collection.
+            The option for the collection.
         """
-        self.add_option(
-            CollectionView(
-                collection,
-                indent,
-                key,
-                0 if self.data is None else self.data.collection_size(collection),
-            )
+        return CollectionView(
+            collection,
+            indent,
+            key,
+            0 if self.data is None else self.data.collection_size(collection),
         )
-        return collection
 
-    def _add_specials(self) -> None:
-        """Add the special collections."""
-        self._add_collection(SpecialCollection.ALL(), key=ShowAll.key_binding())
-        self._add_collection(
+    def _specials(self) -> Iterator[Option]:
+        """The options for the special collections.
+
+        Yields:
+            The options for the special collections.
+        """
+        yield self._collection_option(
+            SpecialCollection.ALL(), key=ShowAll.key_binding()
+        )
+        yield self._collection_option(
             SpecialCollection.UNSORTED(), key=ShowUnsorted.key_binding()
         )
-        self._add_collection(
+        yield self._collection_option(
             SpecialCollection.UNTAGGED(), key=ShowUntagged.key_binding()
         )
         if self.data is not None and self.data.user is not None and self.data.user.pro:
-            self._add_collection(SpecialCollection.BROKEN())
-        self._add_collection(SpecialCollection.TRASH())
+            yield self._collection_option(SpecialCollection.BROKEN())
+        yield self._collection_option(SpecialCollection.TRASH())
 
-    def _add_children_for(
-        self,
-        parent: Collection,
-        indent: int = 0,
-    ) -> None:
-        """Add child collections for the given collection.
+    def _children_for(self, parent: Collection) -> Iterator[Option]:
+        """The options for the child collections of the given collection.
 
         Args:
-            parent: The parent collection to add the children for.
-            indent: The indent level of the parent.
+            parent: The parent collection to get the children for.
+
+        Yields:
+            The options for the child collections.
         """
         assert self.data is not None
-        indent += 1
-        for collection in self.data.collections:
-            if collection.parent == parent.identity:
-                self._add_children_for(self._add_collection(collection, indent), indent)
+        option = self._collection_option
+        for collection, depth in self.data.descendants_of(parent):
+            yield option(collection, depth)
 
-    def _main_navigation(self) -> None:
-        """Set up the main navigation."""
-        with self.preserved_highlight:
-            # First off, clear out the display of the user's groups.
-            self.clear_options()._add_specials()
-            # If we don't have data or we don't know the user, we're all done
-            # here.
-            if self.data is None or self.data.user is None:
-                return
-            # Populate the groups.
-            for group in self.data.user.groups:
-                self.add_option(
-                    Title(f"{group.title} ({len(self.data.collections_within(group))})")
-                )
-                for collection in group.collections:
-                    try:
-                        self._add_children_for(
-                            self._add_collection(self.data.collection(collection))
-                        )
-                    except self.data.UnknownCollection:
-                        # It seems that the Raindrop API can sometimes say
-                        # there's a collection ID in a group where the
-                        # collection ID isn't in the actual collections the
-                        # API gives us. So here we just ignore it.
-                        #
-                        # https://github.com/davep/braindrop/issues/104
-                        pass
+    def _main_navigation(self) -> Iterator[Option]:
+        """The options for the main navigation.
+
+        Yields:
+            The options for the special collections and the user's groups.
+        """
+        yield from self._specials()
+        # If we don't have data or we don't know the user, we're all done
+        # here.
+        if self.data is None or self.data.user is None:
+            return
+        # Populate the groups.
+        for group in self.data.user.groups:
+            yield Title(f"{group.title} ({len(self.data.collections_within(group))})")
+            for collection_id in group.collections:
+                try:
+                    collection = self.data.collection(collection_id)
+                except self.data.UnknownCollection:
+                    # It seems that the Raindrop API can sometimes say
+                    # there's a collection ID in a group where the
+                    # collection ID isn't in the actual collections the
+                    # API gives us. So here we just ignore it.
+                    #
+                    # https://github.com/davep/braindrop/issues/104
+                    continue
+                yield self._collection_option(collection)
+                yield from self._children_for(collection)
 
     @staticmethod
     def _by_name(tags: list[TagCount]) -> list[TagCount]:
@@ -353,47 +434,83 @@ class Navigation(EnhancedOptionList):
         """
         return sorted(tags, key=TagCount.the_count(), reverse=True)
 
-    def _show_types_for(self, collection: Raindrops) -> None:
-        """Show types relating to a given collection.
+    def _types_for(self, collection: Raindrops) -> Iterator[Option]:
+        """The options for the types relating to a given collection.
 
         Args:
             collection: The collection to show the types for.
+
+        Yields:
+            The options for the types.
         """
-        with self.preserved_highlight:
-            if self.data is not None and (types := collection.types):
-                self.add_option(Title(f"Types ({len(types)})"))
-                for raindrop_type in sorted(types):
-                    self.add_option(TypeView(raindrop_type))
+        if self.data is not None and (types := collection.types):
+            yield Title(f"Types ({len(types)})")
+            for raindrop_type in sorted(types):
+                yield TypeView(raindrop_type)
 
-    def _show_tags_for(self, collection: Raindrops) -> None:
-        """Show tags relating a given collection.
+    def _active_tags(self) -> Iterator[Option]:
+        """The options for the tags relating to the active collection.
 
-        Args:
-            collection: The collection to show the tags for.
+        Yields:
+            The options for the tags.
+
+        Notes:
+            The tags of the active collection, and each sorting of them,
+            are gathered once and then reused until either the data or the
+            active collection changes.
         """
+        if self.data is None:
+            return
+        if (tags := self._sorted_tags.get(self.tags_by_count)) is None:
+            if self._tags is None:
+                self._tags = self.active_collection.tags
+            tags = self._sorted_tags[self.tags_by_count] = (
+                self._by_count if self.tags_by_count else self._by_name
+            )(self._tags)
+        if tags:
+            yield Title(f"Tags ({len(tags)})")
+            for tag in tags:
+                yield TagView(tag)
+
+    def _refresh_navigation(self) -> None:
+        """Rebuild the whole of the navigation display.
+
+        Notes:
+            All of the options are gathered up front and then set in one
+            go, so the list is only measured and laid out once.
+
+            The options for the main navigation only depend on the data, so
+            they're built once and reused until the data changes.
+        """
+        if self._main_options is None:
+            self._main_options = list(self._main_navigation())
+        options = [
+            *self._main_options,
+            *self._types_for(self.active_collection),
+            *self._active_tags(),
+        ]
         with self.preserved_highlight:
-            if self.data is not None and (tags := collection.tags):
-                self.add_option(Title(f"Tags ({len(tags)})"))
-                for tag in (self._by_count if self.tags_by_count else self._by_name)(
-                    tags
-                ):
-                    self.add_option(TagView(tag))
+            self.set_options(options)
+
+    def _forget_tags(self) -> None:
+        """Forget the gathered tags of the active collection."""
+        self._tags = None
+        self._sorted_tags.clear()
 
     def watch_data(self) -> None:
         """Handle the data being changed."""
-        self._main_navigation()
-        self.active_collection = self.active_collection
+        self._main_options = None
+        self._forget_tags()
+        self._refresh_navigation()
 
     def watch_active_collection(self) -> None:
         """React to the currently-active collection being changed."""
-        with self.preserved_highlight:
-            self._main_navigation()
-            self._show_types_for(self.active_collection)
-            self._show_tags_for(self.active_collection)
+        self._forget_tags()
+        self._refresh_navigation()
 
     def watch_tags_by_count(self) -> None:
         """React to the tags sort ordering being changed."""
-        self.active_collection = self.active_collection
+        self._refresh_navigation()
 
     @on(OptionList.OptionSelected)
     def _collection_selected(self, message: OptionList.OptionSelected) -> None:
@@ -4,6 +4,7 @@
 # Python imports.
 from collections.abc import Callable
 from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import Any, Final
 
 ##############################################################################
@@ -21,6 +22,7 @@ from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import VerticalScroll
+from textual.content import Content
 from textual.reactive import var
 from textual.widgets import Label, Markdown
 from textual.widgets.option_list import Option
@@ -48,6 +50,24 @@ class Tags(EnhancedOptionList):
     raindrop: var[Raindrop | None] = var(None)
     """The raindrop to show the tags for."""
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _option(cls, tag: str) -> Option:
+        """Get the option for a tag.
+
+        Args:
+            tag: The tag to get the option for.
+
+        Returns:
+            The option for the tag.
+
+        Notes:
+            Many raindrops share the same tags, so rather than make a new
+            option each time a tag is shown, the option is made once and
+            reused.
+        """
+        return Option(f"{cls._ICON} {tag}", id=tag)
+
     def watch_raindrop(self) -> None:
         """Show the tags for the given raindrop.
 
@@ -57,10 +77,7 @@ class Tags(EnhancedOptionList):
         self.clear_options().add_options(
             []
             if self.raindrop is None
-            else (
-                Option(f"{self._ICON} {tag}", id=str(tag))
-                for tag in sorted(self.raindrop.tags)
-            )
+            else (self._option(str(tag)) for tag in sorted(self.raindrop.tags))
         )
         self.set_class(not bool(self.option_count), "empty")
 
@@ -199,6 +216,25 @@ class RaindropDetails(VerticalScroll):
     raindrop: var[Raindrop | None] = var(None)
     """The raindrop to view the details of."""
 
+    def __init__(
+        self,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Initialise the object.
+
+        Args:
+            id: The ID of the widget description in the DOM.
+            classes: The CSS classes of the widget description.
+            disabled: Whether the widget description is disabled or not.
+        """
+        super().__init__(id=id, classes=classes, disabled=disabled)
+        self._displayed: dict[str, str | Content] = {}
+        """The values currently displayed, keyed by widget ID."""
+        self._hidden: bool | None = None
+        """Whether the details are currently hidden, or `None` if not yet known."""
+
     def compose(self) -> ComposeResult:
         """Compose the content of the widget.
 
@@ -217,17 +253,32 @@ class RaindropDetails(VerticalScroll):
         yield Link(id="link", classes="detail")
         yield Tags().data_bind(RaindropDetails.raindrop)
 
-    def _set(
-        self, widget: str, value: str, widget_type: type[Label | Markdown] = Label
-    ) -> None:
+    @cached_property
+    def _details(self) -> dict[str, Label | Markdown]:
+        """The detail widgets, keyed by their ID."""
+        return {
+            detail.id: detail
+            for detail in self.children
+            if isinstance(detail, (Label, Markdown)) and detail.id is not None
+        }
+
+    def _set(self, widget: str, value: str | Content) -> None:
         """Set the value of a detail widget.
 
         Args:
             widget: The ID of the widget to set.
             value: The value to set.
+
+        Notes:
+            If the widget is already showing the value it is left alone.
         """
-        self.query_one(f"#{widget}", widget_type).update(value)
-        self.query_one(f"#{widget}").set_class(not bool(value), "empty")
+        if self._displayed.get(widget) != value:
+            if isinstance(detail := self._details[widget], Markdown):
+                detail.update(str(value))
+            else:
+                detail.update(value)
+            detail.set_class(not bool(value), "empty")
+            self._displayed[widget] = value
 
     @staticmethod
     def _time(
@@ -247,13 +298,14 @@ class RaindropDetails(VerticalScroll):
         Returns:
             The formatted time.
         """
-        if time is not None:
-            time = time.replace(microsecond=0)
-        if if_different_to is not None:
-            if_different_to = if_different_to.replace(microsecond=0)
-        return (
-            "" if time == if_different_to else f"{prefix} {strify(time or 'Unknown')}"
-        )
+        if time is None:
+            return "" if if_different_to is None else f"{prefix} {strify('Unknown')}"
+        time = time.replace(microsecond=0)
+        if if_different_to is not None and time == if_different_to.replace(
+            microsecond=0
+        ):
+            return ""
+        return f"{prefix} {strify(time)}"
 
     def _refresh_display(self) -> None:
         """Refresh the raindrop data display."""
@@ -263,12 +315,13 @@ class RaindropDetails(VerticalScroll):
             self._set("title", escape(self.raindrop.title))
             self._set("borked", "Broken link!" if self.raindrop.broken else "")
             self._set("excerpt", escape(self.raindrop.excerpt))
+            collection = self.data.collection(self.raindrop.collection)
             self._set(
                 "collection",
-                f"{PUBLIC_ICON if self.data.collection(self.raindrop.collection).public else PRIVATE_ICON}"
-                f" {escape(self.data.collection(self.raindrop.collection).title)}",
+                f"{PUBLIC_ICON if collection.public else PRIVATE_ICON}"
+                f" {escape(collection.title)}",
             )
-            self._set("note", self.raindrop.note, Markdown)
+            self._set("note", self.raindrop.note)
             self._set(
                 "created-ish", self._time(self.raindrop.created, "Created", naturaltime)
             )
@@ -291,12 +344,18 @@ class RaindropDetails(VerticalScroll):
             )
             self._set(
                 "link",
-                f"[@click=visit]{self.raindrop.link}[/]" if self.raindrop.link else "",
+                Content(self.raindrop.link).stylize("@click=visit")
+                if self.raindrop.link
+                else "",
             )
         finally:
-            self.query("*").set_class(
-                not (bool(self.data) and bool(self.raindrop)), "hidden"
-            )
+            # Note that only the children need to be hidden; their own
+            # children inherit their visibility.
+            hidden = not (bool(self.data) and bool(self.raindrop))
+            if hidden != self._hidden:
+                for child in self.children:
+                    child.set_class(hidden, "hidden")
+                self._hidden = hidden
 
     def _watch_raindrop(self) -> None:
         """React to the raindrop being changed."""
@@ -3,6 +3,9 @@
 ##############################################################################
 # Python imports.
 from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from time import time
 from typing import Final
 
 ##############################################################################
@@ -18,11 +21,12 @@ from rich.table import Table
 
 ##############################################################################
 # Textual imports.
-from textual import on
+from textual import on, work
 from textual.binding import Binding
 from textual.message import Message
 from textual.reactive import var
 from textual.widgets.option_list import Option
+from textual.worker import Worker, get_current_worker
 
 ##############################################################################
 # Textual enhanced imports.
@@ -36,6 +40,49 @@ from ..data import LocalData, Raindrops
 from .icons import BROKEN_ICON, PRIVATE_ICON, PUBLIC_ICON, UNSORTED_ICON
 
 
+##############################################################################
+class _NaturalTimes:
+    """A cache of the natural descriptions of times.
+
+    Descriptions are relative to now, so the cache is only good for the
+    minute it was filled in; it's emptied as soon as the minute changes.
+    The cache is safe to use from more than one thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the object."""
+        self._lock = Lock()
+        """The lock that guards the cache."""
+        self._minute = 0
+        """The minute the cached descriptions are good for."""
+        self._descriptions: dict[datetime, str] = {}
+        """The cached descriptions, keyed by the time they describe."""
+
+    def __getitem__(self, when: datetime) -> str:
+        """Get the natural description of a time.
+
+        Args:
+            when: The time to describe.
+
+        Returns:
+            The natural description of the time, relative to now.
+        """
+        with self._lock:
+            if (minute := int(time() // 60)) != self._minute:
+                self._minute = minute
+                self._descriptions = {}
+            try:
+                return self._descriptions[when]
+            except KeyError:
+                description = self._descriptions[when] = naturaltime(when)
+                return description
+
+
+##############################################################################
+_natural_times: Final[_NaturalTimes] = _NaturalTimes()
+"""The cache of natural descriptions of raindrop creation times."""
+
+
 ##############################################################################
 class RaindropView(Option):
     """An individual raindrop."""
@@ -44,22 +91,22 @@ class RaindropView(Option):
     """The rule to place at the end of each view."""
 
     def __init__(
-        self, raindrop: Raindrop, data: LocalData | None, compact: bool = False
+        self, raindrop: Raindrop, public: bool = False, compact: bool = False
     ) -> None:
         """Initialise the object.
 
         Args:
             raindrop: The raindrop to view.
+            public: Is the raindrop visible to the public?
+            compact: Use a compact view?
         """
         self._raindrop = raindrop
         """The raindrop to view."""
-        self._public = (
-            False if data is None else data.collection(raindrop.collection).public
-        )
+        self._public = public
         """Is this raindrop visible to the public?"""
         self._compact = compact
         """Use a compact view?"""
-        super().__init__(self.prompt, id=self.id_of(raindrop))
+        super().__init__(self._build_prompt(), id=self.id_of(raindrop))
 
     @staticmethod
     def id_of(raindrop: Raindrop) -> str:
@@ -78,10 +125,16 @@ class RaindropView(Option):
         """The Raindrop being displayed."""
         return self._raindrop
 
-    @property
-    def prompt(self) -> Group:
-        """The prompt for the Raindrop."""
+    def _build_prompt(self) -> Group:
+        """Build the prompt for the Raindrop.
 
+        Returns:
+            The prompt for the Raindrop.
+
+        Notes:
+            This is only called once, when the option is created; after
+            that the prompt is available via the `prompt` property.
+        """
         title = Table.grid(expand=True)
         title.add_column(ratio=1, no_wrap=self._compact)
         title.add_column(justify="right")
@@ -104,12 +157,17 @@ class RaindropView(Option):
             excerpt.add_row(f"[dim]{content}[/dim]")
             body.append(excerpt)
 
+        created = (
+            _natural_times[self._raindrop.created]
+            if self._raindrop.created
+            else "Unknown"
+        )
         details = Table.grid(expand=True)
         details.add_column()
         details.add_column(justify="right")
         details.add_row(
-            f"[dim][italic]{naturaltime(self._raindrop.created) if self._raindrop.created else 'Unknown'}[/][/] ",
-            f"[dim bold italic]{', '.join(str(tag) for tag in sorted(self._raindrop.tags))}[/]",
+            f"[dim][italic]{created}[/][/] ",
+            f"[dim bold italic]{self._raindrop.tag_string}[/]",
         )
 
         return Group(title, *body, details, self.RULE)
@@ -155,14 +213,66 @@ class RaindropsView(EnhancedOptionList):
         """A message sent if the view becomes empty."""
 
     def _add_raindrops(self) -> None:
-        """Add the current raindrops to the display."""
+        """Add the current raindrops to the display.
+
+        Notes:
+            Everything needed from the raindrops and the local data is
+            taken here, on the UI thread, so that the thread that builds the
+            options doesn't look at anything that could change under it.
+        """
+        raindrops = list(self.raindrops)
+        public = (
+            {}
+            if self.data is None
+            else {
+                collection: self.data.collection(collection).public
+                for collection in {raindrop.collection for raindrop in raindrops}
+            }
+        )
+        self._build_raindrops(raindrops, public, self.compact_view)
+
+    @work(thread=True, exclusive=True)
+    def _build_raindrops(
+        self, raindrops: list[Raindrop], public: dict[int, bool], compact: bool
+    ) -> None:
+        """Build the options for the given raindrops.
+
+        Args:
+            raindrops: The raindrops to build the options for.
+            public: The publicity of the raindrops' collections, keyed by
+                collection identity.
+            compact: Use a compact view?
+
+        Notes:
+            The options are built in a thread so that a large collection
+            doesn't hold up the UI; they're then added to the display in
+            one go, back on the UI thread.
+        """
+        worker = get_current_worker()
+        options = [
+            RaindropView(raindrop, public.get(raindrop.collection, False), compact)
+            for raindrop in raindrops
+        ]
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._show_raindrops, worker, options)
+
+    def _show_raindrops(
+        self, worker: Worker[None], raindrops: list[RaindropView]
+    ) -> None:
+        """Show the given raindrops.
+
+        Args:
+            worker: The worker that built the raindrop options.
+            raindrops: The options for the raindrops to show.
+
+        Notes:
+            If the worker has been cancelled in the meantime, a newer set
+            of raindrops is on the way and these are discarded.
+        """
+        if worker.is_cancelled:
+            return
         with self.preserved_highlight:
-            self.clear_options().add_options(
-                [
-                    RaindropView(raindrop, self.data, self.compact_view)
-                    for raindrop in self.raindrops
-                ]
-            )
+            self.clear_options().add_options(raindrops)
         if not self.option_count:
             self.post_message(self.Empty())
 
@@ -12,17 +12,18 @@ Again, for now, this is good enough for my needs.
 
 ##############################################################################
 # Python imports.
-from asyncio import sleep
+from asyncio import Semaphore, TaskGroup, gather, sleep
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from http import HTTPStatus
 from json import loads
+from math import ceil
 from ssl import SSLCertVerificationError
 from typing import Any, Final, Literal
 
 ##############################################################################
 # HTTPX imports.
-from httpx import AsyncClient, HTTPStatusError, RequestError, Response
+from httpx import AsyncClient, HTTPStatusError, Limits, RequestError, Response
 
 ##############################################################################
 # Local imports.
@@ -42,6 +43,15 @@ class API:
     _BASE: Final[str] = "https://api.raindrop.io/rest/v1/"
     """The base of the URL for the API."""
 
+    _KEEP_ALIVE: Final[float] = 60
+    """How long, in seconds, to keep an idle connection to the API open."""
+
+    _PAGE_SIZE: Final[int] = 50
+    """The number of Raindrops to request per page."""
+
+    _CONCURRENT_PAGES: Final[int] = 4
+    """The maximum number of pages of Raindrops to request at once."""
+
     class Error(Exception):
         """Base class for Raindrop errors."""
 
@@ -71,11 +81,32 @@ class API:
 
     @property
     def _client(self) -> AsyncClient:
-        """The HTTPX client."""
+        """The HTTPX client.
+
+        Notes:
+            The one client is used for the lifetime of the API object, so
+            that connections to the API server are reused from call to
+            call. Idle connections are kept around for a while so that
+            calls that come in quick succession (such as the check for
+            fresh data at startup, followed by a download) avoid setting
+            up a fresh connection each time.
+        """
         if self._client_ is None:
-            self._client_ = AsyncClient()
+            self._client_ = AsyncClient(
+                limits=Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=self._KEEP_ALIVE,
+                )
+            )
         return self._client_
 
+    async def close(self) -> None:
+        """Close any connections to the API server."""
+        if self._client_ is not None:
+            await self._client_.aclose()
+            self._client_ = None
+
     def _api_url(self, *path: str) -> str:
         """Construct a URL for calling on the API.
 
@@ -221,7 +252,7 @@ class API:
 
     async def _items_of(
         self, method: Callable[..., Awaitable[str]], *path: str, **params: str
-    ) -> tuple[bool, list[Any] | None]:
+    ) -> tuple[bool, list[Any] | None, int | None]:
         """Get the items of a call to the Raindrop API.
 
         Args:
@@ -230,9 +261,11 @@ class API:
             params: The parameters for the call.
 
         Returns:
-            A tuple of a bool that is the result plus any items from the call.
+            A tuple of a bool that is the result, plus any items from the
+            call, plus the total count of items if the server gave one.
         """
-        return await self._result_of(method, "items", *path, **params)
+        result = loads(await method(*path, **params))
+        return result["result"], result.get("items"), result.get("count")
 
     async def collections(
         self, level: Literal["root", "children", "all"] = "all"
@@ -246,8 +279,11 @@ class API:
             The collections.
         """
         if level == "all":
-            return await self.collections("root") + await self.collections("children")
-        _, collections = await self._items_of(
+            root, children = await gather(
+                self.collections("root"), self.collections("children")
+            )
+            return root + children
+        _, collections, _ = await self._items_of(
             self._get, f"collections{'' if level == 'root' else '/childrens'}"
         )
         return [Collection.from_json(collection) for collection in collections or []]
@@ -311,38 +347,82 @@ class API:
         """
         if not self.maybe_on_the_server(collection):
             raise self.Error(f"{collection} is not a valid collection ID")
-        page = 0
-        raindrops: list[Raindrop] = []
         if count_update is None:
 
             def gndn(_: int) -> None:
                 pass
 
             count_update = gndn
+
+        downloaded = 0
+        concurrency = Semaphore(self._CONCURRENT_PAGES)
+
+        async def page_of(page: int) -> tuple[list[Raindrop], int]:
+            """Get a page of Raindrops.
+
+            Args:
+                page: The page to get.
+
+            Returns:
+                A tuple of the Raindrops on the page, and the total count
+                of Raindrops the server says are in the collection.
+            """
+            nonlocal downloaded
+            async with concurrency:
+                while True:
+                    try:
+                        _, items, count = await self._items_of(
+                            self._get,
+                            "raindrops",
+                            str(int(collection)),
+                            page=str(page),
+                            pagesize=str(self._PAGE_SIZE),
+                        )
+                    except self.RateLimit as limit:
+                        if limit.retry_after is None:
+                            raise self.RequestError(
+                                "Raindrop.io API limit exceeded with no option to retry"
+                            ) from None
+                        count_update(-downloaded)
+                        await sleep(limit.retry_after)
+                        continue
+                    break
+            raindrops = [Raindrop.from_json(raindrop) for raindrop in items or []]
+            downloaded += len(raindrops)
+            count_update(downloaded)
+            return raindrops, count or 0
+
         count_update(0)
-        while True:
+
+        # Get the first page, which also tells us how many Raindrops there
+        # should be in total; with that we can go after all of the other
+        # pages at once.
+        raindrops, total = await page_of(0)
+        pages = max(ceil(total / self._PAGE_SIZE), 1)
+        if raindrops:
+            # Using a task group so that if any one page fails, the requests
+            # for all of the others are cancelled.
             try:
-                _, data = await self._items_of(
-                    self._get,
-                    "raindrops",
-                    str(int(collection)),
-                    page=str(page),
-                    pagesize="50",
-                )
-            except self.RateLimit as limit:
-                if limit.retry_after is None:
-                    raise self.RequestError(
-                        "Raindrop.io API limit exceeded with no option to retry"
-                    ) from None
-                count_update(-len(raindrops))
-                await sleep(limit.retry_after)
-                continue
-            if data:
-                raindrops += [Raindrop.from_json(raindrop) for raindrop in data]
-                count_update(len(raindrops))
-                page += 1
-            else:
+                async with TaskGroup() as requests:
+                    downloads = [
+                        requests.create_task(page_of(page)) for page in range(1, pages)
+                    ]
+            except ExceptionGroup as error:
+                raise error.exceptions[0] from error
+            for download in downloads:
+                raindrops += download.result()[0]
+
+        # The count is only a guide; if things changed while we were
+        # downloading there could be more pages, so keep going until we
+        # find an empty one.
+        page = pages
+        while raindrops:
+            more, _ = await page_of(page)
+            if not more:
                 break
+            raindrops += more
+            page += 1
+
         count_update(len(raindrops))
         return raindrops
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Final, Literal
 
 ##############################################################################
@@ -183,6 +184,17 @@ class Raindrop:
         """Is this raidnrop unsorted?"""
         return self.collection == SpecialCollection.UNSORTED
 
+    @cached_property
+    def tag_string(self) -> str:
+        """The tags of the Raindrop as a single string, for display.
+
+        Notes:
+            Unlike `tags_to_string`, every tag the Raindrop has is included
+            in the string, even if it only differs from another by case.
+            The string is worked out once and then reused.
+        """
+        return ", ".join(map(str, sorted(self.tags)))
+
     def is_tagged(self, *tags: Tag) -> bool:
         """Is the Raindrop tagged with the given tags?
 
@@ -236,9 +248,7 @@ class Raindrop:
             The resulting string will ensure that duplicate tags are
             stripped and that the order is natural sort order.
         """
-        return f"{cls.TAG_STRING_SEPARATOR} ".join(
-            str(tag) for tag in sorted(set(tags))
-        )
+        return f"{cls.TAG_STRING_SEPARATOR} ".join(map(str, sorted(set(tags))))
 
     @classmethod
     def string_to_raw_tags(cls, tags: str) -> list[Tag]:
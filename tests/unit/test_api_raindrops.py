@@ -0,0 +1,130 @@
+"""Tests for downloading Raindrops via the API."""
+
+##############################################################################
+# Python imports.
+from asyncio import sleep
+from json import dumps
+from typing import Any
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Local imports.
+from braindrop.raindrop import API
+
+
+##############################################################################
+class StubAPI(API):
+    """An API whose calls are answered from a fake collection of Raindrops."""
+
+    def __init__(
+        self,
+        total: int,
+        count: int | None = None,
+        rate_limit: set[int] | None = None,
+        fail: set[int] | None = None,
+    ) -> None:
+        """Initialise the object.
+
+        Args:
+            total: The number of Raindrops on the fake server.
+            count: The count the fake server reports, if any.
+            rate_limit: Pages that hit a rate limit the first time they're asked for.
+            fail: Pages that fail.
+        """
+        super().__init__("")
+        self._total = total
+        self._count = count
+        self._rate_limit = rate_limit or set()
+        self._fail = fail or set()
+        self.pages: list[int] = []
+        """The pages requested, in the order they were requested."""
+
+    async def _get(self, *path: str, **params: Any) -> str:
+        page, size = int(params["page"]), int(params["pagesize"])
+        self.pages.append(page)
+        await sleep(0)
+        if page in self._rate_limit:
+            self._rate_limit.remove(page)
+            raise self.RateLimit(0)
+        if page in self._fail:
+            raise self.RequestError("Nope")
+        result: dict[str, Any] = {
+            "result": True,
+            "items": [
+                {"_id": identity}
+                for identity in range(page * size, min((page + 1) * size, self._total))
+            ],
+        }
+        if self._count is not None:
+            result["count"] = self._count
+        return dumps(result)
+
+
+##############################################################################
+async def test_count_is_used_to_fan_out() -> None:
+    """All pages the count says exist should be requested after the first."""
+    api = StubAPI(237, 237)
+    raindrops = await api.raindrops()
+    assert [raindrop.identity for raindrop in raindrops] == list(range(237))
+    assert api.pages[0] == 0
+    assert sorted(api.pages[1:5]) == [1, 2, 3, 4]
+    assert api.pages[5:] == [5]
+
+
+##############################################################################
+async def test_empty_collection() -> None:
+    """An empty collection should only need the one request."""
+    api = StubAPI(0, 0)
+    assert await api.raindrops() == []
+    assert api.pages == [0]
+
+
+##############################################################################
+async def test_missing_count() -> None:
+    """If there's no count, pages should be read until an empty one."""
+    api = StubAPI(120)
+    raindrops = await api.raindrops()
+    assert [raindrop.identity for raindrop in raindrops] == list(range(120))
+    assert api.pages == [0, 1, 2, 3]
+
+
+##############################################################################
+async def test_stale_count() -> None:
+    """If the count is too low, pages should be read until an empty one."""
+    api = StubAPI(237, 120)
+    raindrops = await api.raindrops()
+    assert [raindrop.identity for raindrop in raindrops] == list(range(237))
+    assert api.pages[-3:] == [3, 4, 5]
+
+
+##############################################################################
+async def test_rate_limit_is_retried() -> None:
+    """A page that hits a rate limit should be asked for again."""
+    counts: list[int] = []
+    api = StubAPI(237, 237, rate_limit={2})
+    raindrops = await api.raindrops(count_update=counts.append)
+    assert [raindrop.identity for raindrop in raindrops] == list(range(237))
+    assert api.pages.count(2) == 2
+    assert any(count < 0 for count in counts)
+    assert counts[-1] == 237
+
+
+##############################################################################
+async def test_failure_part_way_through() -> None:
+    """If a page fails, the error should be raised and other pages abandoned."""
+    counts: list[int] = []
+    api = StubAPI(500, 500, fail={2})
+    with raises(API.RequestError) as error:
+        await api.raindrops(count_update=counts.append)
+    assert isinstance(error.value.__cause__, ExceptionGroup)
+    requested, updates = len(api.pages), len(counts)
+    assert 9 not in api.pages
+    await sleep(0.01)
+    assert len(api.pages) == requested
+    assert len(counts) == updates
+
+
+### test_api_raindrops.py ends here
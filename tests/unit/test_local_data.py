@@ -0,0 +1,79 @@
+"""Tests for the local data class."""
+
+##############################################################################
+# Pytest imports.
+from pytest import fixture
+
+##############################################################################
+# Local imports.
+from braindrop.app.data import LocalData
+from braindrop.raindrop import API, Collection
+
+
+##############################################################################
+def make_collection(identity: int, parent: int | None = None) -> Collection:
+    """Make a collection to test with.
+
+    Args:
+        identity: The identity of the collection.
+        parent: The identity of the parent of the collection, if any.
+
+    Returns:
+        The collection.
+    """
+    return Collection.from_json(
+        {"_id": identity, "parent": None if parent is None else {"$id": parent}}
+    )
+
+
+##############################################################################
+@fixture
+def data() -> LocalData:
+    """Fixture for local data holding a small hierarchy of collections."""
+    data = LocalData(API(""))
+    data._set_collections(
+        [
+            make_collection(1),
+            make_collection(2, 1),
+            make_collection(3),
+            make_collection(4, 1),
+            make_collection(5, 2),
+        ]
+    )
+    return data
+
+
+##############################################################################
+def test_children_keep_their_order(data: LocalData) -> None:
+    """Children should come back in the order they're held locally."""
+    assert [child.identity for child in data.children_of(1)] == [2, 4]
+
+
+##############################################################################
+def test_children_of_unknown_parent(data: LocalData) -> None:
+    """An unknown parent should have no children."""
+    assert data.children_of(42) == ()
+
+
+##############################################################################
+def test_children_of_collection_or_identity(data: LocalData) -> None:
+    """Children can be looked up with a collection or its identity."""
+    assert data.children_of(data.collection(2)) == data.children_of(2)
+    assert [child.identity for child in data.children_of(2)] == [5]
+
+
+##############################################################################
+def test_descendants_are_depth_first(data: LocalData) -> None:
+    """Descendants should come back depth-first, with their depth."""
+    assert [
+        (collection.identity, depth) for collection, depth in data.descendants_of(1)
+    ] == [(2, 1), (5, 2), (4, 1)]
+
+
+##############################################################################
+def test_descendants_of_childless_collection(data: LocalData) -> None:
+    """A collection with no children should have no descendants."""
+    assert list(data.descendants_of(3)) == []
+
+
+### test_local_data.py ends here
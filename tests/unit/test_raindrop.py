@@ -196,6 +196,18 @@ def test_make_tag_string_squishes_duplicates_including_case() -> None:
     assert Raindrop.tags_to_string([Tag("a"), Tag("A"), Tag("b")]) == "a, b"
 
 
+##############################################################################
+def test_raindrop_tag_string() -> None:
+    """A Raindrop should be able to give its tags as a string."""
+    assert Raindrop(tags=[Tag("b"), Tag("a")]).tag_string == "a, b"
+
+
+##############################################################################
+def test_raindrop_tag_string_keeps_all_tags() -> None:
+    """A Raindrop's tag string should include tags that only differ by case."""
+    assert Raindrop(tags=[Tag("a"), Tag("B"), Tag("b")]).tag_string == "a, B, b"
+
+
 ##############################################################################
 @mark.parametrize(
     "string",
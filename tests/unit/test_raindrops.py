@@ -149,4 +149,40 @@ def test_filters() -> None:
     assert filters == (text_filter, type_filter, tag_filter)
 
 
+##############################################################################
+def test_equal_raindrops() -> None:
+    """Groups with the same content and filtering should be equal."""
+    raindrops = [Raindrop(identity=identity) for identity in range(10)]
+    assert Raindrops("Test", raindrops) == Raindrops("Test", raindrops)
+    assert Raindrops("Test", raindrops).tagged("tag") == Raindrops(
+        "Test", raindrops
+    ).tagged("tag")
+
+
+##############################################################################
+def test_unequal_raindrops() -> None:
+    """Groups that differ in content or filtering should not be equal."""
+    raindrops = [Raindrop(identity=identity) for identity in range(10)]
+    assert Raindrops("Test", raindrops) != Raindrops("Other", raindrops)
+    assert Raindrops("Test", raindrops) != Raindrops("Test", raindrops[1:])
+    assert Raindrops("Test", raindrops).tagged("tag") != Raindrops(
+        "Test", raindrops
+    ).containing("tag")
+
+
+##############################################################################
+def test_raindrops_compare_with_other_types() -> None:
+    """Comparing a group of Raindrops with something else shouldn't fail."""
+    assert Raindrops("Test") != None  # noqa: E711
+    assert Raindrops("Test") in [None, Raindrops("Test")]
+
+
+##############################################################################
+def test_equal_raindrops_hash_the_same() -> None:
+    """Equal groups of Raindrops should have the same hash."""
+    raindrops = [Raindrop(identity=identity) for identity in range(10)]
+    assert hash(Raindrops("Test", raindrops)) == hash(Raindrops("Test", raindrops))
+    assert len({Raindrops("Test", raindrops), Raindrops("Test", raindrops)}) == 1
+
+
 ### test_raindrops.py ends here
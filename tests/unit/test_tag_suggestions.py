@@ -70,4 +70,18 @@ async def test_order_should_not_matter(suggest_tags: SuggestTags) -> None:
     )
 
 
+##############################################################################
+async def test_add_tags(suggest_tags: SuggestTags) -> None:
+    """Tags added after creation should be suggested."""
+    assert await suggest_tags.get_suggestion("z") is None
+    assert suggest_tags.add_tags([Tag("zzz"), Tag("zzz")]) is True
+    assert await suggest_tags.get_suggestion("z") == Tag("zzz")
+
+
+##############################################################################
+def test_add_known_tags(suggest_tags: SuggestTags) -> None:
+    """Adding tags that are already known should make no difference."""
+    assert suggest_tags.add_tags([TAGS["a"], TAGS["b"]]) is False
+
+
 ### test_tag_suggestions.py ends here